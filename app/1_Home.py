@@ -3,11 +3,11 @@ import numpy as np
 import joblib
 import pandas as pd
 import json
-from PIL import Image
+from assets import get_logo
+from segment_profiles import SEGMENT_NAMES, SEGMENT_PROFILES
 
 # Load your logo
-logo = Image.open("app/omegakavya.jpeg")
-st.sidebar.image(logo, use_container_width=True)
+st.sidebar.image(get_logo("app/omegakavya.jpeg"), use_container_width=True)
 st.sidebar.title("👥 User Segmentation App")
 st.sidebar.markdown("""
 Welcome! This app uses KMeans clustering to segment users based on their attributes.
@@ -22,52 +22,16 @@ scaler = joblib.load("models/scaler.joblib")
 mlb = joblib.load("models/mlb.joblib")
 feature_order = joblib.load("models/feature_order.joblib")
 
-# Segment labels and descriptions
-segment_names = {
-    0: "Digital Natives",
-    1: "Casual Browsers",
-    2: "Power Users",
-    3: "Premium Engagers"
-}
-
-segment_profiles = {
-    "Digital Natives": {
-        "Who": "Tech-savvy users aged 18–24 with high online activity.",
-        "Behavior": "Constant engagement, early adopters, multi-device users.",
-        "Suggestions": [
-            "Use gamified or interactive campaigns.",
-            "Optimize for mobile-first UX.",
-            "Leverage social proof and influencer marketing."
-        ]
-    },
-    "Casual Browsers": {
-        "Who": "Mid-income users aged 25–34 who occasionally browse.",
-        "Behavior": "Moderate online activity with interests in fitness, reading, and tech.",
-        "Suggestions": [
-            "Simplify UI and enhance CTAs.",
-            "Send email nudges to re-engage.",
-            "Use minimal visual campaigns."
-        ]
-    },
-    "Power Users": {
-        "Who": "Highly active users aged 30–45, often professionals.",
-        "Behavior": "High conversion, explore deeply before purchasing.",
-        "Suggestions": [
-            "Provide detailed comparisons and reviews.",
-            "Use remarketing and tailored offers.",
-            "Highlight premium features."
-        ]
-    },
-    "Premium Engagers": {
-        "Who": "Affluent users 35+ with consistent high CTR and loyalty.",
-        "Behavior": "High-value conversions, repeat customers.",
-        "Suggestions": [
-            "Offer loyalty programs and early access.",
-            "Focus on high-quality visuals.",
-            "Use targeted, data-driven remarketing."
-        ]
-    }
-}
+# Lookup tables for encoding a single submission
+encode_maps = {col: {c: i for i, c in enumerate(le.classes_)} for col, le in label_encoders.items()}
+mlb_index = {c: i for i, c in enumerate(mlb.classes_)}
+feature_slots = {f: i for i, f in enumerate(feature_order)}
+interest_slots = np.array([feature_slots[c] for c in mlb.classes_], dtype=np.int32)
+
+# float32 copies of the fitted parameters for single-sample inference
+scaler_mean = scaler.mean_.astype(np.float32) if scaler.with_mean else np.float32(0)
+scaler_scale = scaler.scale_.astype(np.float32)
+cluster_centers = kmeans.cluster_centers_.astype(np.float32)
 
 # Page config
 st.set_page_config(page_title="Segment Predictor", layout="centered")
@@ -101,13 +65,13 @@ with st.form("segment_form"):
 # Prediction logic
 if submitted:
     user_data = {
-        "Age": label_encoders["Age"].transform([age])[0],
-        "Gender": label_encoders["Gender"].transform([gender])[0],
-        "Location": label_encoders["Location"].transform([location])[0],
-        "Language": label_encoders["Language"].transform([language])[0],
-        "Education Level": label_encoders["Education Level"].transform([education])[0],
-        "Device Usage": label_encoders["Device Usage"].transform([device])[0],
-        "Income Level": label_encoders["Income Level"].transform([income])[0],
+        "Age": encode_maps["Age"][age],
+        "Gender": encode_maps["Gender"][gender],
+        "Location": encode_maps["Location"][location],
+        "Language": encode_maps["Language"][language],
+        "Education Level": encode_maps["Education Level"][education],
+        "Device Usage": encode_maps["Device Usage"][device],
+        "Income Level": encode_maps["Income Level"][income],
         "Time Spent Online (hrs/weekday)": weekday_time,
         "Time Spent Online (hrs/weekend)": weekend_time,
         "Click-Through Rates (CTR)": ctr,
@@ -115,33 +79,38 @@ if submitted:
     }
 
     # Interests
-    interest_vec = mlb.transform([interests if interests else []])[0]
+    interest_vec = np.zeros(len(mlb.classes_), np.int8)
+    for interest in interests:
+        interest_vec[mlb_index[interest]] = 1
     interest_data = dict(zip(mlb.classes_, interest_vec))
 
-    full_feature_dict = {**user_data, **interest_data}
-    aligned_features = [full_feature_dict.get(f, 0) for f in feature_order]
-    features_scaled = scaler.transform([aligned_features])
+    aligned_features = np.zeros(len(feature_order), np.float64)
+    for key, value in user_data.items():
+        aligned_features[feature_slots[key]] = value
+    aligned_features[interest_slots] = interest_vec
+    features_scaled = (aligned_features.astype(np.float32) - scaler_mean) / scaler_scale
 
-    segment_id = kmeans.predict(features_scaled)[0]
-    predicted_segment = segment_names.get(segment_id, "Unknown Segment")
+    segment_id = int(np.argmin(((features_scaled - cluster_centers) ** 2).sum(1)))
+    predicted_segment = SEGMENT_NAMES.get(segment_id, "Unknown Segment")
 
     # Output
     st.success(f"🎯 **Predicted Segment:** {predicted_segment}")
 
     with st.expander("📚 Segment Details", expanded=True):
-        profile = segment_profiles.get(predicted_segment)
+        profile = SEGMENT_PROFILES.get(predicted_segment)
         if profile:
-            st.markdown(f"**👥 Who They Are:** {profile['Who']}")
-            st.markdown(f"**🧠 Behavioral Traits:** {profile['Behavior']}")
-            st.markdown("**🛠️ Strategic Suggestions:**")
-            for tip in profile["Suggestions"]:
-                st.markdown(f"- {tip}")
+            parts = [
+                f"**👥 Who They Are:** {profile['Who']}",
+                f"**🧠 Behavioral Traits:** {profile['Behavior']}",
+                "**🛠️ Strategic Suggestions:**"
+            ] + [f"- {tip}" for tip in profile["Suggestions"]]
+            st.markdown("\n\n".join(parts))
 
     # Debug
     with st.expander("🔧 Debug Logs (optional)", expanded=False):
         st.write("📋 Encoded Inputs:", user_data)
         st.write("🎯 Interests Vector:", interest_data)
-        st.write("📊 Final Feature Vector (ordered):", aligned_features)
+        st.write("📊 Final Feature Vector (ordered):", aligned_features.tolist())
 
     # Export
     export_data = {
@@ -159,14 +128,14 @@ if submitted:
 
 # Optional Explorer
 with st.expander("📊 Explore All Segment Profiles", expanded=False):
-    for seg, profile in segment_profiles.items():
-        st.markdown(f"### 🔸 {seg}")
-        st.markdown(f"**👥 Who They Are:** {profile['Who']}")
-        st.markdown(f"**🧠 Behavioral Traits:** {profile['Behavior']}")
-        st.markdown("**🛠️ Strategic Suggestions:**")
-        for tip in profile["Suggestions"]:
-            st.markdown(f"- {tip}")
-        st.markdown("---")
+    for seg, profile in SEGMENT_PROFILES.items():
+        parts = [
+            f"### 🔸 {seg}",
+            f"**👥 Who They Are:** {profile['Who']}",
+            f"**🧠 Behavioral Traits:** {profile['Behavior']}",
+            "**🛠️ Strategic Suggestions:**"
+        ] + [f"- {tip}" for tip in profile["Suggestions"]] + ["---"]
+        st.markdown("\n\n".join(parts))
 
 # Footer
 footer = """
@@ -0,0 +1,8 @@
+import streamlit as st
+from PIL import Image
+
+@st.cache_resource
+def get_logo(path):
+    logo = Image.open(path)
+    logo.load()
+    return logo
@@ -1,11 +1,27 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import io
+import os
+import sys
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import plotly.express as px
-from PIL import Image
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# Make app/ importable when this page is launched on its own
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from assets import get_logo
+from segment_profiles import SEGMENT_NAMES, SEGMENT_PROFILES
+
+SEG_COLOR_MAP = dict(zip(sorted(SEGMENT_NAMES.values()), px.colors.qualitative.Set2))
 
 # ---------- Sidebar Logo & Title ----------
-logo = Image.open("app/omegakavya.jpeg")
-st.sidebar.image(logo, use_container_width=True)
+st.sidebar.image(get_logo("app/omegakavya.jpeg"), use_container_width=True)
 st.sidebar.title("\U0001F4CA Segmentation Dashboard")
 st.sidebar.markdown("Explore data insights for clustered user segments.")
 st.markdown("<style>section[data-testid='stSidebar'] { overflow-y: auto; }</style>", unsafe_allow_html=True)
@@ -16,17 +32,175 @@ st.set_page_config(page_title="\U0001F3AF User Segmentation Dashboard", layout="
 # ---------- Load Data ----------
 @st.cache_data
 def load_data():
-    df = pd.read_csv("data/user_profiles_with_segments.csv")
-    df.columns = df.columns.str.strip()
+    dtypes = {
+        'Segment_Name': 'category',
+        'Income Level': 'category',
+        'Age': 'category',
+        'Gender': 'category',
+        'Device Usage': 'category'
+    }
+    path = "data/user_profiles_with_segments.parquet"
+    csv_path = "data/user_profiles_with_segments.csv"
+    # Only trust the Parquet copy if the CSV hasn't been refreshed since
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(csv_path):
+        df = pd.read_parquet(path).astype(dtypes)
+    else:
+        df = pd.read_csv(csv_path, engine="pyarrow", dtype=dtypes)
     return df
 
 df = load_data()
 
+# ---------- Aggregates ----------
+def aggregate(data):
+    metrics = data.groupby('Segment_Name', observed=True).agg({
+        'Time Spent Online (hrs/weekday)': 'mean',
+        'Time Spent Online (hrs/weekend)': 'mean',
+        'Click-Through Rates (CTR)': 'mean',
+        'Conversion Rates': 'mean'
+    })
+    counts = data['Segment_Name'].value_counts()
+    return {
+        "distribution": counts[counts > 0],
+        "engagement": metrics[
+            ['Time Spent Online (hrs/weekday)', 'Time Spent Online (hrs/weekend)']
+        ].reset_index(),
+        "conversion": metrics[
+            ['Click-Through Rates (CTR)', 'Conversion Rates']
+        ].reset_index(),
+        "income": data.groupby(['Segment_Name', 'Income Level'], observed=True).size().unstack(fill_value=0),
+        "heatmap": metrics[
+            ['Click-Through Rates (CTR)', 'Conversion Rates', 'Time Spent Online (hrs/weekday)', 'Time Spent Online (hrs/weekend)']
+        ]
+    }
+
+@st.cache_data
+def segment_codes():
+    data = load_data()
+    codes = data['Segment_Name'].cat.codes.to_numpy()
+    cat_map = {c: i for i, c in enumerate(data['Segment_Name'].cat.categories)}
+    return codes, cat_map
+
+@st.cache_data
+def filter_segments(segments_key: tuple) -> pd.DataFrame:
+    codes, cat_map = segment_codes()
+    sel_codes = np.fromiter((cat_map[s] for s in segments_key), dtype=np.int16)
+    return load_data().iloc[np.isin(codes, sel_codes)]
+
+@st.cache_data
+def compute_aggregates(segments_key: tuple) -> dict:
+    return aggregate(filter_segments(segments_key))
+
+@st.cache_data
+def precomputed_full() -> dict:
+    return aggregate(load_data())
+
+@st.cache_data
+def make_csv(segments_key: tuple) -> bytes:
+    data = filter_segments(segments_key)
+    buf = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(data, preserve_index=False), buf)
+    return buf.getvalue()
+
+@st.cache_data
+def render_charts(aggs: dict):
+    fig = make_subplots(
+        rows=2,
+        cols=3,
+        specs=[[{}, {}, {}], [{}, {"colspan": 2}, None]],
+        subplot_titles=[
+            "Segment Distribution",
+            "Engagement Patterns",
+            "CTR & Conversion Rates",
+            "Income Distribution",
+            "Segment Metric Heatmap"
+        ],
+        vertical_spacing=0.18
+    )
+
+    # Segment Distribution
+    segment_counts = aggs["distribution"]
+    fig.add_trace(go.Bar(
+        x=segment_counts.index.astype(str),
+        y=segment_counts.values,
+        marker_color=[SEG_COLOR_MAP[seg] for seg in segment_counts.index],
+        name="User Count",
+        hovertemplate="Segment=%{x}<br>User Count=%{y}<extra></extra>",
+        showlegend=False
+    ), 1, 1)
+
+    # Engagement Patterns
+    engagement = aggs["engagement"]
+    for col in ['Time Spent Online (hrs/weekday)', 'Time Spent Online (hrs/weekend)']:
+        fig.add_trace(go.Scatter(
+            x=engagement["Segment_Name"].astype(str),
+            y=engagement[col],
+            mode="lines+markers",
+            name=col,
+            hovertemplate="Segment=%{x}<br>Day Type=" + col + "<br>Avg Hours=%{y}<extra></extra>",
+            legendgroup="engagement",
+            legendgrouptitle_text="Day Type"
+        ), 1, 2)
+
+    # CTR & Conversion
+    conversion = aggs["conversion"]
+    for col in ['Click-Through Rates (CTR)', 'Conversion Rates']:
+        fig.add_trace(go.Scatter(
+            x=conversion["Segment_Name"].astype(str),
+            y=conversion[col],
+            mode="lines+markers",
+            stackgroup="rates",
+            name=col,
+            hovertemplate="Segment=%{x}<br>Metric=" + col + "<br>Rate=%{y}<extra></extra>",
+            legendgroup="rates",
+            legendgrouptitle_text="Metric"
+        ), 1, 3)
+
+    # Income Distribution
+    income = aggs["income"]
+    for level in income.columns:
+        fig.add_trace(go.Bar(
+            x=income.index.astype(str),
+            y=income[level],
+            name=str(level),
+            hovertemplate="Segment=%{x}<br>Income Level=" + str(level) + "<br>User Count=%{y}<extra></extra>",
+            legendgroup="income",
+            legendgrouptitle_text="Income Level"
+        ), 2, 1)
+
+    # Heatmap Comparison
+    heatmap_data = aggs["heatmap"]
+    fig.add_trace(go.Heatmap(
+        z=heatmap_data.to_numpy(),
+        x=list(heatmap_data.columns),
+        y=heatmap_data.index.astype(str),
+        colorscale="YlGnBu",
+        texttemplate="%{z:.2f}",
+        hovertemplate="Metrics: %{x}<br>Segment: %{y}<br>Value: %{z}<extra></extra>",
+        colorbar=dict(title="Value", len=0.4, y=0.2)
+    ), 2, 2)
+
+    for row, col in [(1, 1), (1, 2), (1, 3), (2, 1)]:
+        fig.update_xaxes(title_text="Segment", row=row, col=col)
+    fig.update_xaxes(title_text="Metrics", row=2, col=2)
+    fig.update_yaxes(title_text="User Count", row=1, col=1)
+    fig.update_yaxes(title_text="Avg Hours", row=1, col=2)
+    fig.update_yaxes(title_text="Rate", row=1, col=3)
+    fig.update_yaxes(title_text="User Count", row=2, col=1)
+    fig.update_yaxes(title_text="Segment", autorange="reversed", row=2, col=2)
+    fig.update_layout(barmode="group", height=850, legend=dict(groupclick="toggleitem", tracegroupgap=20))
+    return fig
+
 # ---------- Sidebar Filters ----------
 st.sidebar.header("\U0001F50D Filter Options")
-segments = df['Segment_Name'].unique()
+segments = df['Segment_Name'].unique().tolist()
 selected_segments = st.sidebar.multiselect("Select Segments", segments, default=list(segments))
-filtered_df = df[df['Segment_Name'].isin(selected_segments)]
+segments_key = tuple(sorted(selected_segments))
+if set(selected_segments) == set(segments):
+    filtered_df = df
+    aggs = precomputed_full()
+else:
+    filtered_df = filter_segments(segments_key)
+    aggs = compute_aggregates(segments_key)
 
 # ---------- Dashboard Title ----------
 st.title("\U0001F3AF User Segmentation Analysis Dashboard")
@@ -41,175 +215,41 @@ Use the filters in the sidebar to dive deeper into CTR trends, income groups, en
 # ---------- KPI Metrics ----------
 st.markdown("### \U0001F4CC Overview Metrics")
 col1, col2, col3 = st.columns(3)
-col1.metric("Total Users", f"{len(filtered_df)}")
-col2.metric("Avg CTR", f"{filtered_df['Click-Through Rates (CTR)'].mean():.2%}")
-col3.metric("Avg Conversion", f"{filtered_df['Conversion Rates'].mean():.2%}")
-
-# ---------- Segment Distribution ----------
-st.markdown("### \U0001F4CA Segment Distribution")
-segment_counts = filtered_df['Segment_Name'].value_counts()
-seg_df = pd.DataFrame({
-    "Segment": segment_counts.index,
-    "User Count": segment_counts.values
-})
-fig1 = px.bar(
-    seg_df,
-    x="Segment",
-    y="User Count",
-    color="Segment",
-    title="Segment Distribution",
-    hover_data=["Segment", "User Count"],
-    color_discrete_sequence=px.colors.qualitative.Set2
-)
-st.plotly_chart(fig1, use_container_width=True)
-
-# ---------- Engagement Patterns ----------
-st.markdown("### \U0001F552 Engagement Patterns")
-engagement = filtered_df.groupby('Segment_Name')[
-    ['Time Spent Online (hrs/weekday)', 'Time Spent Online (hrs/weekend)']
-].mean().reset_index()
-fig2 = px.line(
-    engagement.melt(id_vars="Segment_Name"),
-    x="Segment_Name",
-    y="value",
-    color="variable",
-    markers=True,
-    labels={"value": "Avg Hours", "Segment_Name": "Segment", "variable": "Day Type"},
-    title="Engagement Patterns",
-    hover_data=["Segment_Name", "variable", "value"]
-)
-st.plotly_chart(fig2, use_container_width=True)
-
-# ---------- CTR & Conversion ----------
-st.markdown("### \U0001F4C8 CTR & Conversion Rates")
-conversion = filtered_df.groupby('Segment_Name')[
-    ['Click-Through Rates (CTR)', 'Conversion Rates']
-].mean().reset_index()
-fig3 = px.area(
-    conversion.melt(id_vars="Segment_Name"),
-    x="Segment_Name",
-    y="value",
-    color="variable",
-    markers=True,
-    labels={"value": "Rate", "Segment_Name": "Segment", "variable": "Metric"},
-    title="CTR & Conversion Rates",
-    hover_data=["Segment_Name", "variable", "value"]
-)
-st.plotly_chart(fig3, use_container_width=True)
-
-# ---------- Income Distribution ----------
-st.markdown("### \U0001F4B0 Income Distribution by Segment")
-income = pd.crosstab(filtered_df['Segment_Name'], filtered_df['Income Level'])
-income = income.reset_index().melt(id_vars="Segment_Name", var_name="Income Level", value_name="User Count")
-fig4 = px.bar(
-    income,
-    x="Segment_Name",
-    y="User Count",
-    color="Income Level",
-    barmode="group",
-    title="Income Distribution",
-    labels={"Segment_Name": "Segment"},
-    hover_data=["Segment_Name", "Income Level", "User Count"]
-)
-st.plotly_chart(fig4, use_container_width=True)
-
-# ---------- Heatmap Comparison (Optional) ----------
-st.markdown("### \U0001F525 Segment Metric Heatmap")
-heatmap_data = filtered_df.groupby("Segment_Name")[
-    ['Click-Through Rates (CTR)', 'Conversion Rates', 'Time Spent Online (hrs/weekday)', 'Time Spent Online (hrs/weekend)']
-].mean()
-fig5 = px.imshow(
-    heatmap_data,
-    labels=dict(x="Metrics", y="Segment", color="Value"),
-    color_continuous_scale="YlGnBu",
-    title="Segment Metric Heatmap",
-    text_auto=".2f"
-)
-st.plotly_chart(fig5, use_container_width=True)
+arr = filtered_df[['Click-Through Rates (CTR)', 'Conversion Rates']].to_numpy()
+n = arr.shape[0]
+ctr_mean, cr_mean = arr.mean(axis=0) if n else np.full(2, np.nan)
+col1.metric("Total Users", f"{n}")
+col2.metric("Avg CTR", f"{ctr_mean:.2%}")
+col3.metric("Avg Conversion", f"{cr_mean:.2%}")
+
+# ---------- Segment Charts ----------
+st.markdown("### \U0001F4CA Segment Analytics")
+st.plotly_chart(render_charts(aggs), use_container_width=True)
 
 # ---------- Segment Profiles ----------
 st.markdown("### \U0001F4CC Segment Insights & Strategic Recommendations")
 
-segment_profiles = {
-    "Digital Natives": {
-        "Demographics": "35–44, Female",
-        "Income": "100k+",
-        "Online Weekday": "2.8h", "Online Weekend": "4.6h",
-        "CTR": "12.6%", "CR": "5.0%",
-        "Device": "Desktop Only",
-        "Interests": "Travel (122), Gardening (103), Digital Marketing (45)",
-        "Size": 207,
-        "Strategy": [
-            "📱 Prioritize mobile-first experience and social-led promotions",
-            "📸 Use travel/gardening content hooks in social ads",
-            "🎯 Retarget via Instagram & lifestyle platforms"
-        ]
-    },
-    "Casual Browsers": {
-        "Demographics": "25–34, Female",
-        "Income": "40k–60k",
-        "Online Weekday": "2.8h", "Online Weekend": "4.5h",
-        "CTR": "12.2%", "CR": "4.9%",
-        "Device": "Desktop Only",
-        "Interests": "Fitness (96), Reading (95), Digital Marketing (94)",
-        "Size": 484,
-        "Strategy": [
-            "🖼️ Simplify site UI with clear CTAs",
-            "📧 Send regular personalized email nudges",
-            "🎨 Visually-driven campaigns with light interactions"
-        ]
-    },
-    "Power Users": {
-        "Demographics": "25–34, Male",
-        "Income": "0–20k",
-        "Online Weekday": "2.8h", "Online Weekend": "4.7h",
-        "CTR": "12.9%", "CR": "4.8%",
-        "Device": "Mobile Only",
-        "Interests": "Finance (155), Cooking (32), Wellness (27)",
-        "Size": 155,
-        "Strategy": [
-            "📊 Use dashboards, push insights, and real-time nudges",
-            "📈 Upsell premium finance tools or investment content",
-            "🧪 A/B test deep-link features for power workflows"
-        ]
-    },
-    "Premium Engagers": {
-        "Demographics": "25–34, Female",
-        "Income": "20k–40k",
-        "Online Weekday": "2.7h", "Online Weekend": "4.7h",
-        "CTR": "13.1%", "CR": "5.3%",
-        "Device": "Desktop Only",
-        "Interests": "Pet Care (154), Data Science (30), Digital Marketing (25)",
-        "Size": 154,
-        "Strategy": [
-            "🎁 Offer exclusives: early access, beta invites, curated newsletters",
-            "📣 Focus on value-driven campaigns with loyalty perks",
-            "🧠 Use data-driven storytelling in email & blog formats"
-        ]
-    }
-}
-
 # Render Segment Cards
 for seg in selected_segments:
-    if seg in segment_profiles:
-        prof = segment_profiles[seg]
+    if seg in SEGMENT_PROFILES:
+        prof = SEGMENT_PROFILES[seg]
         with st.expander(f"\U0001F4C2 {seg} — {prof['Size']} users", expanded=True):
-            st.markdown(f"**\U0001F465 Demographics:** {prof['Demographics']}")
-            st.markdown(f"**\U0001F4B5 Income Level:** {prof['Income']}")
-            st.markdown(f"**⏱️ Online Time:** {prof['Online Weekday']} weekdays, {prof['Online Weekend']} weekends")
-            st.markdown(f"**\U0001F4CA CTR / Conversion:** {prof['CTR']} / {prof['CR']}")
-            st.markdown(f"**\U0001F4BB Preferred Device:** {prof['Device']}")
-            st.markdown(f"**\U0001F3AF Top Interests:** {prof['Interests']}")
-            st.markdown("**\U0001F4A1 Strategic Actions:**")
-            for tip in prof['Strategy']:
-                st.markdown(f"- {tip}")
+            parts = [
+                f"**\U0001F465 Demographics:** {prof['Demographics']}",
+                f"**\U0001F4B5 Income Level:** {prof['Income']}",
+                f"**⏱️ Online Time:** {prof['Online Weekday']} weekdays, {prof['Online Weekend']} weekends",
+                f"**\U0001F4CA CTR / Conversion:** {prof['CTR']} / {prof['CR']}",
+                f"**\U0001F4BB Preferred Device:** {prof['Device']}",
+                f"**\U0001F3AF Top Interests:** {prof['Interests']}",
+                "**\U0001F4A1 Strategic Actions:**"
+            ] + [f"- {tip}" for tip in prof['Strategy']]
+            st.markdown("\n\n".join(parts))
 
 # ---------- Export Button ----------
 st.markdown("### \U0001F4E5 Export Data")
-csv = filtered_df.to_csv(index=False)
 st.download_button(
     label="Download Filtered Data as CSV",
-    data=csv,
+    data=make_csv(segments_key),
     file_name='filtered_user_segments.csv',
     mime='text/csv'
 )
@@ -0,0 +1,103 @@
+# Segment labels (KMeans cluster id -> name)
+SEGMENT_NAMES = {
+    0: "Digital Natives",
+    1: "Casual Browsers",
+    2: "Power Users",
+    3: "Premium Engagers"
+}
+
+# Segment descriptions shared by the predictor and the dashboard
+SEGMENT_PROFILES = {
+    "Digital Natives": {
+        "Who": "Tech-savvy users aged 18–24 with high online activity.",
+        "Behavior": "Constant engagement, early adopters, multi-device users.",
+        "Suggestions": [
+            "Use gamified or interactive campaigns.",
+            "Optimize for mobile-first UX.",
+            "Leverage social proof and influencer marketing."
+        ],
+        "Demographics": "35–44, Female",
+        "Income": "100k+",
+        "Online Weekday": "2.8h",
+        "Online Weekend": "4.6h",
+        "CTR": "12.6%",
+        "CR": "5.0%",
+        "Device": "Desktop Only",
+        "Interests": "Travel (122), Gardening (103), Digital Marketing (45)",
+        "Size": 207,
+        "Strategy": [
+            "📱 Prioritize mobile-first experience and social-led promotions",
+            "📸 Use travel/gardening content hooks in social ads",
+            "🎯 Retarget via Instagram & lifestyle platforms"
+        ]
+    },
+    "Casual Browsers": {
+        "Who": "Mid-income users aged 25–34 who occasionally browse.",
+        "Behavior": "Moderate online activity with interests in fitness, reading, and tech.",
+        "Suggestions": [
+            "Simplify UI and enhance CTAs.",
+            "Send email nudges to re-engage.",
+            "Use minimal visual campaigns."
+        ],
+        "Demographics": "25–34, Female",
+        "Income": "40k–60k",
+        "Online Weekday": "2.8h",
+        "Online Weekend": "4.5h",
+        "CTR": "12.2%",
+        "CR": "4.9%",
+        "Device": "Desktop Only",
+        "Interests": "Fitness (96), Reading (95), Digital Marketing (94)",
+        "Size": 484,
+        "Strategy": [
+            "🖼️ Simplify site UI with clear CTAs",
+            "📧 Send regular personalized email nudges",
+            "🎨 Visually-driven campaigns with light interactions"
+        ]
+    },
+    "Power Users": {
+        "Who": "Highly active users aged 30–45, often professionals.",
+        "Behavior": "High conversion, explore deeply before purchasing.",
+        "Suggestions": [
+            "Provide detailed comparisons and reviews.",
+            "Use remarketing and tailored offers.",
+            "Highlight premium features."
+        ],
+        "Demographics": "25–34, Male",
+        "Income": "0–20k",
+        "Online Weekday": "2.8h",
+        "Online Weekend": "4.7h",
+        "CTR": "12.9%",
+        "CR": "4.8%",
+        "Device": "Mobile Only",
+        "Interests": "Finance (155), Cooking (32), Wellness (27)",
+        "Size": 155,
+        "Strategy": [
+            "📊 Use dashboards, push insights, and real-time nudges",
+            "📈 Upsell premium finance tools or investment content",
+            "🧪 A/B test deep-link features for power workflows"
+        ]
+    },
+    "Premium Engagers": {
+        "Who": "Affluent users 35+ with consistent high CTR and loyalty.",
+        "Behavior": "High-value conversions, repeat customers.",
+        "Suggestions": [
+            "Offer loyalty programs and early access.",
+            "Focus on high-quality visuals.",
+            "Use targeted, data-driven remarketing."
+        ],
+        "Demographics": "25–34, Female",
+        "Income": "20k–40k",
+        "Online Weekday": "2.7h",
+        "Online Weekend": "4.7h",
+        "CTR": "13.1%",
+        "CR": "5.3%",
+        "Device": "Desktop Only",
+        "Interests": "Pet Care (154), Data Science (30), Digital Marketing (25)",
+        "Size": 154,
+        "Strategy": [
+            "🎁 Offer exclusives: early access, beta invites, curated newsletters",
+            "📣 Focus on value-driven campaigns with loyalty perks",
+            "🧠 Use data-driven storytelling in email & blog formats"
+        ]
+    }
+}
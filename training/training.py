@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
+import scipy.sparse as sp
 from sklearn.preprocessing import LabelEncoder, StandardScaler, MultiLabelBinarizer
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 import matplotlib.pyplot as plt
 import seaborn as sns
 import joblib
@@ -28,23 +29,25 @@ for col in categorical_cols:
 df['Top Interests'] = df['Top Interests'].fillna('')
 interests_list = df['Top Interests'].str.split(', ')
 
-mlb = MultiLabelBinarizer()
-interests_encoded = mlb.fit_transform(interests_list)
-interests_df = pd.DataFrame(interests_encoded, columns=mlb.classes_)
+mlb = MultiLabelBinarizer(sparse_output=True)
+interests_sparse = mlb.fit_transform(interests_list).tocsr()
 
-df_processed = pd.concat([df.drop('Top Interests', axis=1), interests_df], axis=1)
+numeric_cols = list(df.drop('Top Interests', axis=1).columns)
+numeric = df[numeric_cols].to_numpy(dtype=np.float32)
+X = sp.hstack([sp.csr_matrix(numeric), interests_sparse], format='csr', dtype=np.float32)
 
 # --- 3. Feature Scaling ---
-scaler = StandardScaler()
-df_scaled = scaler.fit_transform(df_processed)
+# Centering would densify the sparse matrix; K-Means is translation invariant so only scale
+scaler = StandardScaler(with_mean=False)
+df_scaled = scaler.fit_transform(X)
 
 # --- 4. Determine Optimal Clusters ---
 inertia = []
 K_range = range(1, 11)
 for k in K_range:
-    kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-    kmeans.fit(df_scaled)
-    inertia.append(kmeans.inertia_)
+    elbow_model = MiniBatchKMeans(n_clusters=k, random_state=42, n_init=3, batch_size=1024)
+    elbow_model.fit(df_scaled)
+    inertia.append(elbow_model.inertia_)
 
 # --- 5. K-Means Clustering ---
 optimal_k = 4
@@ -83,45 +86,59 @@ df_decoded = df.copy()
 for col in categorical_cols:
     df_decoded[col] = label_encoders[col].inverse_transform(df_decoded[col])
 
+# Profile every segment in a single grouped pass
+mode = lambda s: s.mode().iat[0]
+agg_spec = {
+    'Size': ('Age', 'size'),
+    'Age': ('Age', mode),
+    'Gender': ('Gender', mode),
+    'Income': ('Income Level', mode),
+    'Weekday': ('Time Spent Online (hrs/weekday)', 'mean'),
+    'Weekend': ('Time Spent Online (hrs/weekend)', 'mean'),
+    'CTR': ('Click-Through Rates (CTR)', 'mean'),
+    'Conversion': ('Conversion Rates', 'mean'),
+    'Device': ('Device Usage', mode)
+}
+profile_df = df_decoded.groupby('Segment').agg(**agg_spec)
+
+# Interest totals per segment (segments x interests) in one pass over the one-hot matrix
+segment_onehot = sp.csr_matrix(
+    (np.ones(len(df), dtype=np.int32), (df['Segment'].to_numpy(), np.arange(len(df)))),
+    shape=(optimal_k, len(df))
+)
+interest_totals = (segment_onehot @ interests_sparse).toarray()
+top_k = min(3, interest_totals.shape[1])
+top_idx = np.argpartition(-interest_totals, top_k - 1, axis=1)[:, :top_k]
+
 # Analyze each segment
-for segment_id, segment_name in segment_names.items():
-    segment_data = df_decoded[df_decoded['Segment'] == segment_id]
+for profile in profile_df.itertuples():
+    segment_id = profile.Index
+    segment_name = segment_names[segment_id]
 
     print(f"\n🏷️  {segment_name.upper()} (Segment {segment_id})")
-    print(f"    Size: {len(segment_data)} users")
+    print(f"    Size: {profile.Size} users")
     print(f"    Key Characteristics:")
 
     # Demographics
-    most_common_age = segment_data['Age'].mode()[0]
-    most_common_gender = segment_data['Gender'].mode()[0]
-    most_common_income = segment_data['Income Level'].mode()[0]
-
-    print(f"    • Primary Demographics: {most_common_age}, {most_common_gender}")
-    print(f"    • Income Level: {most_common_income}")
+    print(f"    • Primary Demographics: {profile.Age}, {profile.Gender}")
+    print(f"    • Income Level: {profile.Income}")
 
     # Engagement metrics
-    avg_weekday_time = segment_data['Time Spent Online (hrs/weekday)'].mean()
-    avg_weekend_time = segment_data['Time Spent Online (hrs/weekend)'].mean()
-    avg_ctr = segment_data['Click-Through Rates (CTR)'].mean()
-    avg_conversion = segment_data['Conversion Rates'].mean()
-
-    print(f"    • Online Time: {avg_weekday_time:.1f}h weekdays, {avg_weekend_time:.1f}h weekends")
-    print(f"    • Click Rate: {avg_ctr:.1%} | Conversion Rate: {avg_conversion:.1%}")
+    print(f"    • Online Time: {profile.Weekday:.1f}h weekdays, {profile.Weekend:.1f}h weekends")
+    print(f"    • Click Rate: {profile.CTR:.1%} | Conversion Rate: {profile.Conversion:.1%}")
 
     # Device preference
-    most_common_device = segment_data['Device Usage'].mode()[0]
-    print(f"    • Preferred Device: {most_common_device}")
-
-    # Top interests - use the original interests_df with segment mapping
-    segment_interests_data = interests_df[df['Segment'] == segment_id]
-    if len(segment_interests_data) > 0:
-        interest_sums = segment_interests_data.sum().sort_values(ascending=False)
-        top_interests = interest_sums.head(3)
-        if len(top_interests) > 0 and top_interests.iloc[0] > 0:
-            interests_str = ", ".join([f"{interest} ({count})" for interest, count in top_interests.items() if count > 0])
-            print(f"    • Top Interests: {interests_str}")
-        else:
-            print(f"    • Top Interests: No specific interests identified")
+    print(f"    • Preferred Device: {profile.Device}")
+
+    # Top interests
+    seg_top = top_idx[segment_id]
+    seg_top = seg_top[np.argsort(-interest_totals[segment_id, seg_top], kind='stable')]
+    top_interests = [(mlb.classes_[j], interest_totals[segment_id, j]) for j in seg_top]
+    if len(top_interests) > 0 and top_interests[0][1] > 0:
+        interests_str = ", ".join([f"{interest} ({count})" for interest, count in top_interests if count > 0])
+        print(f"    • Top Interests: {interests_str}")
+    else:
+        print(f"    • Top Interests: No specific interests identified")
 
 # --- 7. Visualizations ---
 print(f"\n📈 GENERATING VISUALIZATIONS...")
@@ -178,7 +195,7 @@ for segment, recommendation in recommendations.items():
     print(f"    Strategy: {recommendation}")
 
 # --- 9. Save Models and Data ---
-feature_order = list(df_processed.columns)
+feature_order = numeric_cols + list(mlb.classes_)
 joblib.dump(kmeans, 'kmeans_model.joblib')
 joblib.dump(label_encoders, 'label_encoders.joblib')
 joblib.dump(scaler, 'scaler.joblib')
@@ -188,7 +205,9 @@ joblib.dump(feature_order, 'feature_order.joblib')
 # Save with segment names
 for col in categorical_cols:
     df[col] = label_encoders[col].inverse_transform(df[col])
+df.columns = df.columns.str.strip()
 df.to_csv('user_profiles_with_segments.csv', index=False)
+df.to_parquet('user_profiles_with_segments.parquet', compression='snappy', index=False)
 
 print(f"\n✅ Analysis complete! Model and data saved successfully.")
-print(f"   📁 Files saved: kmeans_model.joblib, user_profiles_with_segments.csv")
\ No newline at end of file
+print(f"   📁 Files saved: kmeans_model.joblib, user_profiles_with_segments.csv, user_profiles_with_segments.parquet")
\ No newline at end of file